@@ -1,4 +1,9 @@
+import io
 from pathlib import Path
+
+import pandas as pd
+import pytest
+
 from wiz_report_tool.data_loader import load_csv
 
 
@@ -8,3 +13,103 @@ def test_load_csv():
         df = load_csv(f)
     assert list(df.columns) == ["id", "name", "score"]
     assert len(df) == 3
+
+
+def test_load_csv_types_during_parse():
+    pytest.importorskip("pyarrow")
+    sample = Path(__file__).parent / "sample_data" / "sample_100.csv"
+    df = load_csv(sample, threads=2, block_size=1 << 16)
+    assert df.attrs["load_info"] == {
+        "engine": "pyarrow",
+        "path": "arrow-native",
+        "threads": 2,
+        "block_size": 1 << 16,
+    }
+    assert len(df) == 100
+    assert pd.api.types.is_datetime64_dtype(df["Created At"])
+    assert df["Created At"].dt.tz is None
+
+
+def test_load_csv_date_format_and_dtype():
+    pytest.importorskip("pyarrow")
+    data = io.BytesIO(b"id;seen;score\n1;06.08.2025 03:08;7\n2;;8\n")
+    df = load_csv(data, dtype={"score": "float64"}, date_format="%d.%m.%Y %H:%M")
+    assert pd.api.types.is_datetime64_dtype(df["seen"])
+    assert df["seen"].isna().sum() == 1
+    assert df["score"].dtype == "float64"
+
+
+def test_load_csv_pandas_engine_reports_path():
+    fixture = Path(__file__).parent / "fixtures" / "sample.csv"
+    df = load_csv(fixture, engine="c")
+    assert df.attrs["load_info"]["engine"] == "c"
+    assert df.attrs["load_info"]["path"] == "pandas"
+    with pytest.raises(ValueError):
+        load_csv(fixture, engine="polars")
+
+
+@pytest.mark.parametrize("threads", [None, 1, 2])
+def test_load_csv_leaves_arrow_pool_untouched(threads):
+    pa = pytest.importorskip("pyarrow")
+    before = pa.cpu_count()
+    sample = Path(__file__).parent / "sample_data" / "sample_100.csv"
+    df = load_csv(sample, threads=threads)
+    expected = before if threads is None else threads
+    assert df.attrs["load_info"]["threads"] == expected
+    assert len(df) == 100
+    assert pa.cpu_count() == before
+
+
+@pytest.mark.parametrize("threads", [0, -1])
+def test_load_csv_rejects_invalid_threads(threads):
+    fixture = Path(__file__).parent / "fixtures" / "sample.csv"
+    with pytest.raises(ValueError):
+        load_csv(fixture, threads=threads)
+
+
+def test_load_csv_nullable_extension_dtypes():
+    pytest.importorskip("pyarrow")
+    data = io.BytesIO(b"a;b;c\n1;true;1.5\n;;\n")
+    df = load_csv(data, dtype={"a": "Int64", "b": "boolean", "c": "Float64"})
+    assert df["a"].dtype == "Int64"
+    assert df["b"].dtype == "boolean"
+    assert df["c"].dtype == "Float64"
+    assert df["a"].isna().sum() == 1
+    with pytest.raises(ValueError, match="interval"):
+        load_csv(io.BytesIO(b"a\n1\n"), dtype={"a": "interval"})
+
+
+def test_load_csv_arrow_dtype_and_scalar_dtype():
+    pa = pytest.importorskip("pyarrow")
+    df = load_csv(io.BytesIO(b"a;b\n1;x\n2;y\n"), dtype={"a": pa.int32()})
+    assert df["a"].dtype == "int32"
+    with pytest.raises(ValueError, match="per-column"):
+        load_csv(io.BytesIO(b"a;b\n1;2\n"), dtype="float64")
+    df = load_csv(io.BytesIO(b"a;b\n1;2\n"), dtype="float64", engine="c")
+    assert (df.dtypes == "float64").all()
+
+
+def test_load_csv_multiline_values_across_blocks():
+    pytest.importorskip("pyarrow")
+    rows = [
+        f'{i};"{{\n  ""name"": ""res-{i}"",\n  ""tags"": []\n}}";open'
+        for i in range(5000)
+    ]
+    data = ("id;Resource original JSON;status\n" + "\n".join(rows) + "\n").encode()
+    assert len(data) > 4 * (1 << 16)
+    df = load_csv(io.BytesIO(data), block_size=1 << 16)
+    assert len(df) == 5000
+    assert df["id"].tolist() == list(range(5000))
+    assert df.loc[42, "Resource original JSON"].startswith('{\n  "name": "res-42"')
+    assert (df["status"] == "open").all()
+
+
+def test_load_csv_converts_offsets_to_utc():
+    pytest.importorskip("pyarrow")
+    data = io.BytesIO(b"seen\n2025-01-01T10:00:00+02:00\n2025-01-01T10:00:00Z\n")
+    df = load_csv(data)
+    assert df["seen"].dt.tz is None
+    assert df["seen"].tolist() == [
+        pd.Timestamp("2025-01-01 08:00:00"),
+        pd.Timestamp("2025-01-01 10:00:00"),
+    ]
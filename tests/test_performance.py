@@ -1,4 +1,8 @@
+import subprocess
+import sys
+
 import pandas as pd
+import pytest
 from pathlib import Path
 
 from wiz_report_tool.performance import benchmark_csv
@@ -28,3 +32,32 @@ def test_benchmark_csv_sample_files():
         assert "c" in results
         for t in results.values():
             assert t >= 0
+
+
+def test_benchmark_csv_ingestion_modes(tmp_path):
+    pytest.importorskip("pyarrow")
+    root = Path(__file__).resolve().parents[1]
+    csv_path = tmp_path / "wiz_2000.csv"
+    subprocess.run(
+        [
+            sys.executable,
+            str(root / "fill_csv_synthetic.py"),
+            "-i",
+            str(root / "data" / "Sample.csv"),
+            "-o",
+            str(csv_path),
+            "-n",
+            "2000",
+            "--seed",
+            "1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    # Several blocks so threads and block size come into play
+    assert csv_path.stat().st_size > 4 * (1 << 16)
+    results = benchmark_csv(csv_path, repeats=1, threads=2, block_size=1 << 16)
+    print(f"file={csv_path.name} -> {results}")
+    assert set(results) == {"c", "pyarrow", "arrow", "arrow-1"}
+    for t in results.values():
+        assert t >= 0
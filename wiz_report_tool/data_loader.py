@@ -1,16 +1,168 @@
+import io
+import threading
 import pandas as pd
+import numpy as np
 from importlib.util import find_spec
 
+ENGINES = ("auto", "arrow", "pyarrow", "c")
 
-def load_csv(file) -> pd.DataFrame:
+# Arrow's CPU pool is process wide; loads that resize it take turns
+_ARROW_POOL_LOCK = threading.Lock()
+
+
+def _arrow_type(dtype):
+    """Translate a pandas style dtype into the matching ``pyarrow`` type."""
+    import pyarrow as pa
+
+    if isinstance(dtype, pa.DataType):
+        return dtype
+    try:
+        resolved = pd.api.types.pandas_dtype(dtype)
+    except TypeError:
+        raise ValueError(f"Unsupported dtype {dtype!r} for the arrow engine")
+    if isinstance(resolved, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+    if isinstance(resolved, pd.StringDtype) or resolved == np.dtype(object):
+        return pa.string()
+    # Nullable extension dtypes (Int64, Float64, boolean, ...)
+    numpy_dtype = getattr(resolved, "numpy_dtype", resolved)
+    try:
+        return pa.from_numpy_dtype(np.dtype(numpy_dtype))
+    except (TypeError, pa.ArrowNotImplementedError):
+        raise ValueError(f"Unsupported dtype {dtype!r} for the arrow engine")
+
+
+def _read_arrow(file, dtype, date_format, threads, block_size) -> pd.DataFrame:
+    """Parse with ``pyarrow.csv`` so typing happens in the multi-threaded reader."""
+    import pyarrow as pa
+    from pyarrow import csv
+
+    if isinstance(file, io.TextIOBase):
+        file = io.BytesIO(file.read().encode("utf-8"))
+
+    dtype = dtype or {}
+    read_kwargs = {"use_threads": threads != 1}
+    if block_size is not None:
+        read_kwargs["block_size"] = block_size
+    timestamp_parsers = [csv.ISO8601]
+    if date_format is not None:
+        timestamp_parsers.insert(0, date_format)
+    convert_options = csv.ConvertOptions(
+        column_types={col: _arrow_type(t) for col, t in dtype.items()},
+        timestamp_parsers=timestamp_parsers,
+        strings_can_be_null=True,
+    )
+
+    def parse():
+        return csv.read_csv(
+            file,
+            read_options=csv.ReadOptions(encoding="utf-8", **read_kwargs),
+            # Wiz exports carry multi-line JSON in quoted cells
+            parse_options=csv.ParseOptions(delimiter=";", newlines_in_values=True),
+            convert_options=convert_options,
+        )
+
+    if threads == 1:
+        table = parse()
+    else:
+        # Any parse on the shared pool holds the lock, so none of them can
+        # run on (or report) a pool another load has resized
+        with _ARROW_POOL_LOCK:
+            previous_threads = pa.cpu_count()
+            if threads is None:
+                threads = previous_threads
+            else:
+                pa.set_cpu_count(threads)
+            try:
+                table = parse()
+            finally:
+                pa.set_cpu_count(previous_threads)
+
+    # Drop timezones while still in Arrow so ``filter_dataframe`` has no
+    # conversion left to do. Arrow keeps instants in UTC, so the result is
+    # UTC wall time rather than the wall time of the original offset.
+    schema = pa.schema(
+        [
+            field.with_type(pa.timestamp(field.type.unit))
+            if pa.types.is_timestamp(field.type) and field.type.tz is not None
+            else field
+            for field in table.schema
+        ]
+    )
+    df = table.cast(schema).to_pandas(use_threads=threads != 1)
+
+    # Arrow hands back numpy dtypes; restore requested pandas extension dtypes
+    extension = {
+        col: t
+        for col, t in dtype.items()
+        if col in df.columns
+        and not isinstance(t, pa.DataType)
+        and isinstance(pd.api.types.pandas_dtype(t), pd.api.extensions.ExtensionDtype)
+    }
+    if extension:
+        df = df.astype(extension)
+    return df, threads
+
+
+def load_csv(
+    file,
+    dtype=None,
+    date_format=None,
+    threads=None,
+    block_size=None,
+    engine="auto",
+) -> pd.DataFrame:
     """Load CSV from uploaded file into a DataFrame.
     Handles common separators and missing values.
-    Uses the ``pyarrow`` engine when available for faster parsing
+
+    With ``engine="auto"`` the native ``pyarrow`` reader is used when
+    available: the file is split into blocks of ``block_size`` bytes and parsed
+    on ``threads`` cores, with numeric and datetime columns
+    converted during the parse. ``date_format`` adds a ``strptime`` format
+    tried before ISO 8601 when detecting datetimes. Timestamps with an offset
+    are converted to UTC and returned timezone naive. ``dtype`` forces column
+    types and must be a mapping of column name to dtype on this path, since
+    the columns are not known before the parse; a single dtype for the whole
+    frame raises ``ValueError``. Quoted values may span several lines.
+    ``"pyarrow"`` and ``"c"`` use ``pandas.read_csv`` with that engine; those
+    paths only honour ``dtype``.
+
+    Arrow's thread pool is shared by the whole process. ``threads=None`` uses
+    its current size and any other count resizes it for the duration of the
+    parse. Multi-threaded parses are serialised by a lock so that none runs
+    on, or reports, a pool resized by another load; ``threads=1`` does not
+    use the pool and runs concurrently.
+
+    The engine and path that were used are reported in
+    ``df.attrs["load_info"]``.
     """
-    kwargs = {"delimiter": ";", "encoding": "utf-8"}
-    if find_spec("pyarrow") is not None:
-        kwargs["engine"] = "pyarrow"
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+    if engine == "auto":
+        engine = "arrow" if find_spec("pyarrow") is not None else "c"
+    if threads is not None and threads < 1:
+        raise ValueError(f"threads must be at least 1, got {threads}")
+
+    if engine == "arrow":
+        if dtype is not None and not isinstance(dtype, dict):
+            raise ValueError(
+                f"The arrow engine needs a per-column dtype mapping, got {dtype!r}"
+            )
+        df, threads = _read_arrow(file, dtype, date_format, threads, block_size)
+        info = {
+            "engine": "pyarrow",
+            "path": "arrow-native",
+            "threads": threads,
+            "block_size": block_size,
+        }
     else:
-        kwargs["low_memory"] = False
-    df = pd.read_csv(file, **kwargs)
+        kwargs = {"delimiter": ";", "encoding": "utf-8", "engine": engine}
+        if dtype is not None:
+            kwargs["dtype"] = dtype
+        if engine != "pyarrow":
+            kwargs["low_memory"] = False
+        df = pd.read_csv(file, **kwargs)
+        info = {"engine": engine, "path": "pandas", "threads": None, "block_size": None}
+
+    df.attrs["load_info"] = info
     return df
@@ -57,12 +57,22 @@ def apply_filters(df: pd.DataFrame, filter_rows, logic: str, numeric_cols, date_
     return df
 
 
-def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Interactive sorting and filtering controls for a DataFrame."""
+def infer_column_types(df: pd.DataFrame):
+    """Convert numeric and datetime columns and return them with the frame."""
     numeric_cols: list[str] = []
     date_cols: list[str] = []
     for col in df.columns:
         series = df[col]
+        # Columns already typed by the loader need no further conversion
+        if pd.api.types.is_datetime64_any_dtype(series):
+            if isinstance(series.dtype, pd.DatetimeTZDtype):
+                df[col] = series.dt.tz_localize(None)
+            date_cols.append(col)
+            continue
+        if pd.api.types.is_numeric_dtype(series):
+            numeric_cols.append(col)
+            continue
+
         non_empty = series.astype(str).str.strip() != ""
         num_series = pd.to_numeric(series, errors="coerce")
         if non_empty.any() and num_series[non_empty].notna().all():
@@ -76,6 +86,12 @@ def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
                 date_series = date_series.dt.tz_localize(None)
             df[col] = date_series
             date_cols.append(col)
+    return df, numeric_cols, date_cols
+
+
+def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Interactive sorting and filtering controls for a DataFrame."""
+    df, numeric_cols, date_cols = infer_column_types(df)
 
     st.subheader("Sort")
     sort_cols = st.multiselect("Columns", options=list(df.columns))
@@ -3,41 +3,62 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 from importlib.util import find_spec
 import time
-import pandas as pd
 
+from wiz_report_tool.data_loader import load_csv
+from wiz_report_tool.filters import infer_column_types
 
-def benchmark_csv(path: Path, repeats: int = 3) -> Dict[str, float]:
-    """Benchmark CSV loading for available pandas engines.
+
+def benchmark_csv(
+    path: Path,
+    repeats: int = 3,
+    threads: Optional[int] = None,
+    block_size: Optional[int] = None,
+) -> Dict[str, float]:
+    """Benchmark CSV ingestion for the available modes.
+
+    Each timing covers loading the file and typing its columns the way
+    ``filter_dataframe`` does, so modes that type during the parse are
+    compared against the pandas engines plus their conversion pass.
 
     Parameters
     ----------
     path:
-        Path to the CSV file.
+        Path to the CSV file, e.g. a Wiz issue export.
     repeats:
-        How many times each engine should load the file. The returned value is
+        How many times each mode should load the file. The returned value is
         the average duration in seconds.
+    threads:
+        Thread count for the native ``pyarrow`` reader. Defaults to all cores.
+    block_size:
+        Block size in bytes for the native ``pyarrow`` reader.
 
     Returns
     -------
     dict
-        Mapping of engine name to average load duration.
+        Mapping of mode name to average ingestion duration. ``"c"`` and
+        ``"pyarrow"`` are the ``pandas.read_csv`` engines, ``"arrow"`` is the
+        typed multi-threaded reader and ``"arrow-1"`` the same reader on a
+        single thread.
     """
-    engines = ["c"]
+    modes = {"c": {"engine": "c"}}
     if find_spec("pyarrow") is not None:
-        engines.append("pyarrow")
+        modes["pyarrow"] = {"engine": "pyarrow"}
+        modes["arrow"] = {
+            "engine": "arrow",
+            "threads": threads,
+            "block_size": block_size,
+        }
+        modes["arrow-1"] = {"engine": "arrow", "threads": 1, "block_size": block_size}
 
     results: Dict[str, float] = {}
-    for engine in engines:
+    for mode, kwargs in modes.items():
         total = 0.0
         for _ in range(repeats):
             start = time.perf_counter()
-            kwargs = {"delimiter": ";", "encoding": "utf-8", "engine": engine}
-            if engine != "pyarrow":
-                kwargs["low_memory"] = False
-            pd.read_csv(path, **kwargs)
+            infer_column_types(load_csv(path, **kwargs))
             total += time.perf_counter() - start
-        results[engine] = total / repeats
+        results[mode] = total / repeats
     return results